@@ -1,7 +1,7 @@
 # Colored terminal output for Python's logging module.
 #
 # Author: Peter Odding <peter@peterodding.com>
-# Last Change: June 11, 2021
+# Last Change: October 16, 2026
 # URL: https://coloredlogs.readthedocs.io
 
 """
@@ -200,17 +200,26 @@ Classes and functions
 """
 
 # Standard library modules.
+import bisect
 import collections
+import functools
 import logging
 import os
 import re
-import socket
 import sys
 
 # External dependencies.
 from humanfriendly import coerce_boolean
 from humanfriendly.compat import coerce_string, is_string, on_windows
-from humanfriendly.terminal import ANSI_COLOR_CODES, ansi_wrap, enable_ansi_support, terminal_supports_colors
+from humanfriendly.terminal import (
+    ANSI_COLOR_CODES,
+    ANSI_RESET,
+    ansi_style,
+    ansi_wrap,
+    enable_ansi_support,
+    readline_wrap,
+    terminal_supports_colors,
+)
 from humanfriendly.text import format, split
 
 # Semi-standard module versioning.
@@ -228,32 +237,46 @@ DEFAULT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 CHROOT_FILES = ['/etc/debian_chroot']
 """A list of filenames that indicate a chroot and contain the name of the chroot."""
 
-DEFAULT_FIELD_STYLES = dict(
-    asctime=dict(color='green'),
-    hostname=dict(color='magenta'),
-    levelname=dict(color='black', bold=True),
-    name=dict(color='blue'),
-    programname=dict(color='cyan'),
-    username=dict(color='yellow'),
-)
+# Cache for the results of find_level_index().
+_level_index_cache = {}
+
+# Cache for the results of find_hostname().
+_hostname_cache = {}
+
+# The date/time format that BasicFormatter.formatTime() renders without
+# time.strftime() (this is the original value of DEFAULT_DATE_FORMAT, which
+# callers are free to change).
+_simple_date_format = '%Y-%m-%d %H:%M:%S'
+
+DEFAULT_FIELD_STYLES = {
+    'asctime': {'color': 'green'},
+    'hostname': {'color': 'magenta'},
+    'levelname': {'color': 'black', 'bold': True},
+    'name': {'color': 'blue'},
+    'programname': {'color': 'cyan'},
+    'username': {'color': 'yellow'},
+}
 """Mapping of log format names to default font styles."""
 
-DEFAULT_LEVEL_STYLES = dict(
-    spam=dict(color='green', faint=True),
-    debug=dict(color='green'),
-    verbose=dict(color='blue'),
-    info=dict(),
-    notice=dict(color='magenta'),
-    warning=dict(color='yellow'),
-    success=dict(color='green', bold=True),
-    error=dict(color='red'),
-    critical=dict(color='red', bold=True),
-)
+DEFAULT_LEVEL_STYLES = {
+    'spam': {'color': 'green', 'faint': True},
+    'debug': {'color': 'green'},
+    'verbose': {'color': 'blue'},
+    'info': {},
+    'notice': {'color': 'magenta'},
+    'warning': {'color': 'yellow'},
+    'success': {'color': 'green', 'bold': True},
+    'error': {'color': 'red'},
+    'critical': {'color': 'red', 'bold': True},
+}
 """Mapping of log level names to default font styles."""
 
 DEFAULT_FORMAT_STYLE = '%'
 """The default logging format style (a single character)."""
 
+WHITESPACE_PATTERN = re.compile(r'(\s+)')
+"""Compiled regular expression used to split text on whitespace (keeping the whitespace)."""
+
 FORMAT_STYLE_PATTERNS = {
     '%': r'%\((\w+)\)[#0 +-]*\d*(?:\.\d+)?[hlL]?[diouxXeEfFgGcrs%]',
     '{': r'{(\w+)[^}]*}',
@@ -404,12 +427,13 @@ def install(level=None, **kw):
     # Remove any existing stream handler that writes to stdout or stderr, even
     # if the stream handler wasn't created by coloredlogs because multiple
     # stream handlers (in the same hierarchy) writing to stdout or stderr would
-    # create duplicate output.  `None' is a synonym for the possibly dynamic
-    # value of the stderr attribute of the sys module.
+    # create duplicate output. Identity checks are used because the stream
+    # was defaulted to sys.stderr above (so it's never None) and we don't want
+    # to depend on the __eq__() implementation of arbitrary file-like objects.
     match_streams = ([sys.stdout, sys.stderr]
-                     if stream in [sys.stdout, sys.stderr, None]
+                     if stream is sys.stdout or stream is sys.stderr
                      else [stream])
-    match_handler = lambda handler: match_stream_handler(handler, match_streams)
+    match_handler = functools.partial(match_stream_handler, streams=match_streams)
     handler, logger = replace_handler(logger, match_handler, reconfigure)
     # Make sure reconfiguration is allowed or not relevant.
     if not (handler and not reconfigure):
@@ -570,10 +594,13 @@ def increase_verbosity():
     Understands custom logging levels like defined by my ``verboselogs``
     module.
     """
-    defined_levels = sorted(set(find_defined_levels().values()))
-    current_index = defined_levels.index(get_level())
-    selected_index = max(0, current_index - 1)
-    set_level(defined_levels[selected_index])
+    defined_levels = find_level_index().sorted_levels
+    # Using bisect_left() the current level is found by binary search and
+    # levels that aren't defined select the closest defined level below.
+    current_index = bisect.bisect_left(defined_levels, get_level())
+    # Leave the level unchanged when there's no defined level below it.
+    if current_index > 0:
+        set_level(defined_levels[current_index - 1])
 
 
 def decrease_verbosity():
@@ -583,10 +610,14 @@ def decrease_verbosity():
     Understands custom logging levels like defined by my ``verboselogs``
     module.
     """
-    defined_levels = sorted(set(find_defined_levels().values()))
-    current_index = defined_levels.index(get_level())
-    selected_index = min(current_index + 1, len(defined_levels) - 1)
-    set_level(defined_levels[selected_index])
+    defined_levels = find_level_index().sorted_levels
+    # Using bisect_right() the index following the current level is found by
+    # binary search and levels that aren't defined select the closest defined
+    # level above.
+    selected_index = bisect.bisect_right(defined_levels, get_level())
+    # Leave the level unchanged when there's no defined level above it.
+    if selected_index < len(defined_levels):
+        set_level(defined_levels[selected_index])
 
 
 def is_verbose():
@@ -673,14 +704,62 @@ def find_defined_levels():
      'ERROR': 40,
      'FATAL': 50,
      'CRITICAL': 50}
+
+    The scan of the :mod:`logging` module is cached until attributes are
+    added to (or removed from) the :mod:`logging` module, which is how custom
+    log levels like those of my ``verboselogs`` package are defined.
+    """
+    # Return a copy so that callers can't corrupt the cache.
+    return dict(find_level_index().defined_levels)
+
+
+def find_level_index():
+    """
+    Find the defined logging levels, their numbers and aliases (using a cache).
+
+    :returns: A :class:`LevelIndex` object. The values in this object are
+              shared between callers so they must not be modified.
+
+    The :mod:`logging` module is scanned once and everything needed by
+    :func:`find_defined_levels()`, :func:`find_level_aliases()`,
+    :func:`level_to_number()` and the verbosity helpers is derived from that
+    single scan. The cached result is reused as long as the :mod:`logging`
+    module defines the same uppercase names and all of the cached levels
+    still have the same values (this notices levels that are defined,
+    redefined or removed after the first scan).
     """
-    defined_levels = {}
-    for name in dir(logging):
-        if name.isupper():
-            value = getattr(logging, name)
-            if isinstance(value, int):
-                defined_levels[name] = value
-    return defined_levels
+    key = frozenset(name for name in vars(logging) if name.isupper())
+    index = _level_index_cache.get(key)
+    if index is not None:
+        for name, value in index.defined_levels.items():
+            if getattr(logging, name, None) != value:
+                index = None
+                break
+    if index is None:
+        defined_levels = {}
+        for name in dir(logging):
+            if name.isupper():
+                value = getattr(logging, name)
+                if isinstance(value, int):
+                    defined_levels[name] = value
+        mapping = {}
+        for name, value in defined_levels.items():
+            mapping.setdefault(value, []).append(name)
+        level_aliases = {}
+        for value, names in mapping.items():
+            if len(names) > 1:
+                names = sorted(names, key=lambda n: len(n))
+                canonical_name = names.pop()
+                for alias in names:
+                    level_aliases[alias] = canonical_name
+        index = LevelIndex(
+            defined_levels=defined_levels,
+            level_aliases=level_aliases,
+            sorted_levels=tuple(sorted(mapping)),
+        )
+        _level_index_cache.clear()
+        _level_index_cache[key] = index
+    return index
 
 
 def level_to_number(value):
@@ -693,12 +772,8 @@ def level_to_number(value):
     This function translates log level names into their numeric values..
     """
     if is_string(value):
-        try:
-            defined_levels = find_defined_levels()
-            value = defined_levels[value.upper()]
-        except KeyError:
-            # Don't fail on unsupported log levels.
-            value = DEFAULT_LOG_LEVEL
+        # Don't fail on unsupported log levels.
+        value = find_level_index().defined_levels.get(value.upper(), DEFAULT_LOG_LEVEL)
     return value
 
 
@@ -719,17 +794,8 @@ def find_level_aliases():
     >>> find_level_aliases()
     {'WARN': 'WARNING', 'FATAL': 'CRITICAL'}
     """
-    mapping = collections.defaultdict(list)
-    for name, value in find_defined_levels().items():
-        mapping[value].append(name)
-    aliases = {}
-    for value, names in mapping.items():
-        if len(names) > 1:
-            names = sorted(names, key=lambda n: len(n))
-            canonical_name = names.pop()
-            for alias in names:
-                aliases[alias] = canonical_name
-    return aliases
+    # Return a copy so that callers can't corrupt the cache.
+    return dict(find_level_index().level_aliases)
 
 
 def parse_encoded_styles(text, normalize_key=None):
@@ -788,8 +854,32 @@ def find_hostname(use_chroot=True):
     Looks for :data:`CHROOT_FILES` that have a nonempty first line (taken to be
     the chroot name). If none are found then :func:`socket.gethostname()` is
     used as a fall back.
+
+    The result is cached so that repeated calls (for example when
+    :func:`install()` is called multiple times) don't need to access the file
+    system and call :func:`socket.gethostname()` again. Changes to
+    :data:`CHROOT_FILES` are respected.
+    """
+    key = (use_chroot, tuple(CHROOT_FILES))
+    if key not in _hostname_cache:
+        _hostname_cache[key] = find_hostname_uncached()
+    return _hostname_cache[key]
+
+
+def find_hostname_uncached():
+    """
+    Find the host name to include in log messages (without caching).
+
+    :returns: A suitable host name (a string).
+
+    Refer to :func:`find_hostname()` for details.
     """
+    import socket
     for chroot_file in CHROOT_FILES:
+        # Avoid raising (and swallowing) an exception in the common case
+        # where the file doesn't exist.
+        if not os.path.isfile(chroot_file):
+            continue
         try:
             with open(chroot_file) as handle:
                 first_line = next(handle)
@@ -901,7 +991,7 @@ def find_handler(logger, match_handler):
     return None, None
 
 
-def match_stream_handler(handler, streams=[]):
+def match_stream_handler(handler, streams=None):
     """
     Identify stream handlers writing to the given streams(s).
 
@@ -914,7 +1004,7 @@ def match_stream_handler(handler, streams=[]):
     This function can be used as a callback for :func:`find_handler()`.
     """
     return (isinstance(handler, logging.StreamHandler)
-            and getattr(handler, 'stream') in (streams or (sys.stdout, sys.stderr)))
+            and handler.stream in (streams or (sys.stdout, sys.stderr)))
 
 
 def walk_propagation_tree(logger):
@@ -933,14 +1023,13 @@ def walk_propagation_tree(logger):
         # Yield the logger to our caller.
         yield logger
         # Check if the logger has propagation enabled.
-        if logger.propagate:
-            # Continue with the parent logger. We use getattr() because the
-            # `parent' attribute isn't documented so properly speaking we
-            # shouldn't break if it's not available.
-            logger = getattr(logger, 'parent', None)
-        else:
+        if not logger.propagate:
             # The propagation chain stops here.
-            logger = None
+            return
+        # Continue with the parent logger. We use getattr() because the
+        # `parent' attribute isn't documented so properly speaking we
+        # shouldn't break if it's not available.
+        logger = getattr(logger, 'parent', None)
 
 
 class BasicFormatter(logging.Formatter):
@@ -955,6 +1044,12 @@ class BasicFormatter(logging.Formatter):
     .. _#45: https://github.com/xolox/python-coloredlogs/issues/45
     """
 
+    timestamp_cache = (None, None, None)
+    """
+    The most recently formatted timestamp (a tuple of three values: the number
+    of seconds since the epoch, the date/time format and the formatted string).
+    """
+
     def formatTime(self, record, datefmt=None):
         """
         Format the date/time of a log record.
@@ -969,6 +1064,11 @@ class BasicFormatter(logging.Formatter):
 
         When `datefmt` contains the token ``%f`` it will be replaced by the
         value of ``%(msecs)03d`` (refer to issue `#45`_ for use cases).
+
+        Because date/time formats without ``%f`` have a resolution of one
+        second, the most recently formatted timestamp is remembered (see
+        :attr:`timestamp_cache`) and reused for log records that were
+        created during the same second.
         """
         # The default value of the following argument is defined here so
         # that Sphinx doesn't embed the default value in the generated
@@ -977,8 +1077,23 @@ class BasicFormatter(logging.Formatter):
         # Replace %f with the value of %(msecs)03d.
         if '%f' in datefmt:
             datefmt = datefmt.replace('%f', '%03d' % record.msecs)
-        # Delegate the actual date/time formatting to the base formatter.
-        return logging.Formatter.formatTime(self, record, datefmt)
+            return logging.Formatter.formatTime(self, record, datefmt)
+        # Reuse the previous timestamp when the second hasn't changed.
+        seconds = int(record.created)
+        cached_seconds, cached_datefmt, cached_text = self.timestamp_cache
+        if seconds == cached_seconds and datefmt == cached_datefmt:
+            return cached_text
+        if datefmt == _simple_date_format:
+            # The default date/time format is simple enough to render without
+            # time.strftime() (which needs to interpret the format string).
+            text = '%04d-%02d-%02d %02d:%02d:%02d' % tuple(self.converter(record.created)[:6])
+        else:
+            # Delegate the actual date/time formatting to the base formatter.
+            text = logging.Formatter.formatTime(self, record, datefmt)
+        # We update the cache using a single assignment because
+        # formatters can be shared between threads (handlers).
+        self.timestamp_cache = (seconds, datefmt, text)
+        return text
 
 
 class ColoredFormatter(BasicFormatter):
@@ -1032,6 +1147,24 @@ class ColoredFormatter(BasicFormatter):
         # Initialize the superclass with the rewritten format string.
         logging.Formatter.__init__(self, **kw)
 
+    @property
+    def level_styles(self):
+        """
+        A dictionary with level styles (the keys are normalized level names).
+
+        Assigning a new dictionary to this attribute discards the escape
+        sequences cached by :func:`get_level_markup()`. Changes made to the
+        dictionary in place are noticed by :func:`get_level_markup()` as well.
+        """
+        return self._level_styles
+
+    @level_styles.setter
+    def level_styles(self, value):
+        """Change the level styles and discard the cached escape sequences."""
+        self._level_styles = value
+        # The ANSI escape sequences for level styles are computed on demand.
+        self.level_markup = {}
+
     def colorize_format(self, fmt, style=DEFAULT_FORMAT_STYLE):
         """
         Rewrite a logging format string to inject ANSI escape sequences.
@@ -1070,8 +1203,11 @@ class ColoredFormatter(BasicFormatter):
         """
         result = []
         parser = FormatStringParser(style=style)
+        # Bind the field style lookup to local variables (it's used in loops).
+        get_style = self.nn.get
+        field_styles = self.field_styles
         for group in parser.get_grouped_pairs(fmt):
-            applicable_styles = [self.nn.get(self.field_styles, token.name) for token in group if token.name]
+            applicable_styles = [get_style(field_styles, token.name) for token in group if token.name]
             if sum(map(bool, applicable_styles)) == 1:
                 # If exactly one (1) field style is available for the group of
                 # tokens then all of the tokens will be styled the same way.
@@ -1086,12 +1222,52 @@ class ColoredFormatter(BasicFormatter):
                 for token in group:
                     text = token.text
                     if token.name:
-                        field_styles = self.nn.get(self.field_styles, token.name)
-                        if field_styles:
-                            text = ansi_wrap(text, **field_styles)
+                        token_style = get_style(field_styles, token.name)
+                        if token_style:
+                            text = ansi_wrap(text, **token_style)
                     result.append(text)
         return ''.join(result)
 
+    def get_level_markup(self, name):
+        """
+        Get the ANSI escape sequences that implement the style of a log level.
+
+        :param name: The name of a log level (a string).
+        :returns: A tuple with two strings (the escape sequences that should
+                  precede and follow the log message) or an empty tuple if
+                  no style is defined for the given log level.
+
+        The escape sequences are computed once per level name and cached in
+        the ``level_markup`` attribute, this enables :func:`format()` to style
+        log messages using simple string concatenation instead of calling
+        :func:`~humanfriendly.terminal.ansi_wrap()` for each log record. The
+        cache is keyed by the level name exactly as given, so that the level
+        names of log records can be looked up without normalizing them. Each
+        cache entry remembers the style it was computed from and is discarded
+        when :attr:`level_styles` no longer contains that style.
+        """
+        entry = self.level_markup.get(name)
+        if entry is not None:
+            normalized_name, cached_style, markup = entry
+            if self.level_styles.get(normalized_name) == cached_style:
+                return markup
+        else:
+            normalized_name = self.nn.normalize_name(name)
+        style = self.level_styles.get(normalized_name)
+        prefix = ansi_style(**style) if style else ''
+        if prefix:
+            # This mirrors the logic in humanfriendly.terminal.ansi_wrap().
+            suffix = ANSI_RESET
+            if style.get('readline_hints'):
+                suffix = readline_wrap(suffix)
+            markup = (prefix, suffix)
+        else:
+            markup = ()
+        # We store a copy of the style so that changes made to the style
+        # in place invalidate the cache entry.
+        self.level_markup[name] = (normalized_name, dict(style) if style is not None else None, markup)
+        return markup
+
     def format(self, record):
         """
         Apply level-specific styling to log records.
@@ -1101,49 +1277,46 @@ class ColoredFormatter(BasicFormatter):
 
         This method injects ANSI escape sequences that are specific to the
         level of each log record (because such logic cannot be expressed in the
-        syntax of a log format string). It works by making a copy of the log
-        record, changing the `msg` field inside the copy and passing the copy
-        into the :func:`~logging.Formatter.format()` method of the base
-        class.
+        syntax of a log format string). It works by temporarily changing the
+        `msg` field of the log record while the :func:`~logging.Formatter.format()`
+        method of the base class is running. Afterwards the `msg` and `message`
+        fields are restored so that other formatters and handlers are not
+        affected.
         """
-        style = self.nn.get(self.level_styles, record.levelname)
-        # After the introduction of the `Empty' class it was reported in issue
-        # 33 that format() can be called when `Empty' has already been garbage
-        # collected. This explains the (otherwise rather out of place) `Empty
-        # is not None' check in the following `if' statement. The reasoning
-        # here is that it's much better to log a message without formatting
-        # then to raise an exception ;-).
-        #
-        # For more details refer to issue 33 on GitHub:
-        # https://github.com/xolox/python-coloredlogs/issues/33
-        if style and Empty is not None:
+        markup = self.get_level_markup(record.levelname)
+        if markup:
             # Due to the way that Python's logging module is structured and
             # documented the only (IMHO) clean way to customize its behavior is
             # to change incoming LogRecord objects before they get to the base
             # formatter. However we don't want to break other formatters and
-            # handlers, so we copy the log record.
+            # handlers, so we restore the log record afterwards.
             #
             # In the past this used copy.copy() but as reported in issue 29
-            # (which is reproducible) this can cause deadlocks. The following
-            # Python voodoo is intended to accomplish the same thing as
-            # copy.copy() without all of the generalization and overhead that
-            # we don't need for our -very limited- use case.
+            # (which is reproducible) this can cause deadlocks. After that the
+            # log record was copied using some Python voodoo, however saving
+            # and restoring the two fields that we actually change avoids
+            # allocating a new object for every styled log record.
             #
             # For more details refer to issue 29 on GitHub:
             # https://github.com/xolox/python-coloredlogs/issues/29
-            copy = Empty()
-            copy.__class__ = record.__class__
-            copy.__dict__.update(record.__dict__)
-            copy.msg = ansi_wrap(coerce_string(record.msg), **style)
-            record = copy
+            original_msg = record.msg
+            original_message = record.__dict__.get('message')
+            # Log messages are nearly always strings, in which case we can
+            # skip the call to coerce_string().
+            message = original_msg if type(original_msg) is str else coerce_string(original_msg)
+            record.msg = markup[0] + message + markup[1]
+            try:
+                return logging.Formatter.format(self, record)
+            finally:
+                record.msg = original_msg
+                if original_message is None:
+                    record.__dict__.pop('message', None)
+                else:
+                    record.message = original_message
         # Delegate the remaining formatting to the base formatter.
         return logging.Formatter.format(self, record)
 
 
-class Empty(object):
-    """An empty class used to copy :class:`~logging.LogRecord` objects without reinitializing them."""
-
-
 class HostNameFilter(logging.Filter):
 
     """
@@ -1184,12 +1357,14 @@ class HostNameFilter(logging.Filter):
 
         If `fmt` is given the filter will only be installed if `fmt` uses the
         ``hostname`` field. If `fmt` is not given the filter is installed
-        unconditionally.
+        unconditionally. Existing filters of the same type are replaced, so
+        that repeated calls don't install duplicate filters.
         """
         if fmt:
             parser = FormatStringParser(style=style)
             if not parser.contains_field(fmt, 'hostname'):
                 return
+        handler.filters = [f for f in handler.filters if not isinstance(f, cls)]
         handler.addFilter(cls(use_chroot))
 
     def __init__(self, use_chroot=True):
@@ -1237,12 +1412,14 @@ class ProgramNameFilter(logging.Filter):
 
         If `fmt` is given the filter will only be installed if `fmt` uses the
         ``programname`` field. If `fmt` is not given the filter is installed
-        unconditionally.
+        unconditionally. Existing filters of the same type are replaced, so
+        that repeated calls don't install duplicate filters.
         """
         if fmt:
             parser = FormatStringParser(style=style)
             if not parser.contains_field(fmt, 'programname'):
                 return
+        handler.filters = [f for f in handler.filters if not isinstance(f, cls)]
         handler.addFilter(cls(programname))
 
     def __init__(self, programname=None):
@@ -1291,12 +1468,14 @@ class UserNameFilter(logging.Filter):
 
         If `fmt` is given the filter will only be installed if `fmt` uses the
         ``username`` field. If `fmt` is not given the filter is installed
-        unconditionally.
+        unconditionally. Existing filters of the same type are replaced, so
+        that repeated calls don't install duplicate filters.
         """
         if fmt:
             parser = FormatStringParser(style=style)
             if not parser.contains_field(fmt, 'username'):
                 return
+        handler.filters = [f for f in handler.filters if not isinstance(f, cls)]
         handler.addFilter(cls(username))
 
     def __init__(self, username=None):
@@ -1395,14 +1574,13 @@ class FormatStringParser(object):
         # Step 1: Split simple tokens (without a name) into
         # their whitespace parts and non-whitespace parts.
         separated = []
-        pattern = re.compile(r'(\s+)')
         for token in self.get_pairs(format_string):
             if token.name:
                 separated.append(token)
             else:
                 separated.extend(
                     FormatStringToken(name=None, text=text)
-                    for text in pattern.split(token.text) if text
+                    for text in WHITESPACE_PATTERN.split(token.text) if text
                 )
         # Step 2: Group tokens together based on whitespace.
         current_group = []
@@ -1466,6 +1644,28 @@ class FormatStringToken(collections.namedtuple('FormatStringToken', 'text, name'
     """
 
 
+class LevelIndex(collections.namedtuple('LevelIndex', 'defined_levels, level_aliases, sorted_levels')):
+
+    """
+    A named tuple for the results of :func:`find_level_index()`.
+
+    .. attribute:: defined_levels
+
+       A dictionary with level names as keys and integers as values (refer to
+       :func:`find_defined_levels()`).
+
+    .. attribute:: level_aliases
+
+       A dictionary that maps aliases to their canonical name (refer to
+       :func:`find_level_aliases()`).
+
+    .. attribute:: sorted_levels
+
+       A tuple with the unique numbers of the defined levels, sorted in
+       ascending order.
+    """
+
+
 class NameNormalizer(object):
 
     """Responsible for normalizing field and level names."""
@@ -1473,6 +1673,7 @@ class NameNormalizer(object):
     def __init__(self):
         """Initialize a :class:`NameNormalizer` object."""
         self.aliases = {k.lower(): v.lower() for k, v in find_level_aliases().items()}
+        self.normalized_names = {}
 
     def normalize_name(self, name):
         """
@@ -1498,11 +1699,16 @@ class NameNormalizer(object):
         | FATAL    | critical |
         | CRITICAL | critical |
         -----------------------
+
+        The results are cached in the ``normalized_names`` attribute because
+        the same few names are normalized over and over again.
         """
-        name = name.lower()
-        if name in self.aliases:
-            name = self.aliases[name]
-        return name
+        normalized_name = self.normalized_names.get(name)
+        if normalized_name is None:
+            normalized_name = name.lower()
+            normalized_name = self.aliases.get(normalized_name, normalized_name)
+            self.normalized_names[name] = normalized_name
+        return normalized_name
 
     def normalize_keys(self, value):
         """
@@ -1521,4 +1727,4 @@ class NameNormalizer(object):
         :param name: A key to normalize and get from the dictionary.
         :returns: The value of the normalized key (if any).
         """
-        return normalized_dict.get(self.normalize_name(name))
+        return normalized_dict.get(self.normalize_name(name)) if normalized_dict else None
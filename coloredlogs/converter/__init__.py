@@ -1,7 +1,7 @@
 # Program to convert text with ANSI escape sequences to HTML.
 #
 # Author: Peter Odding <peter@peterodding.com>
-# Last Change: February 14, 2020
+# Last Change: October 16, 2026
 # URL: https://coloredlogs.readthedocs.io
 
 """Convert text with ANSI escape sequences to HTML."""
@@ -35,6 +35,9 @@ INDENT_PATTERN = re.compile('^ +', re.MULTILINE)
 # Compiled regular expression that matches a tag followed by a space at the start of a line.
 TAG_INDENT_PATTERN = re.compile('^(<[^>]+>) ', re.MULTILINE)
 
+# Compiled regular expression that matches runs of multiple spaces.
+SPACES_PATTERN = re.compile(' {2,}')
+
 # Compiled regular expression that matches strings we want to convert. Used to
 # separate all special strings and literal output in a single pass (this allows
 # us to properly encode the output without resorting to nasty hacks).
@@ -256,11 +259,11 @@ def encode_whitespace(text, tabsize=4):
     # Convert leading spaces (that is to say spaces at the start of the string
     # and/or directly after a line ending) into non-breaking spaces, otherwise
     # HTML rendering engines will simply ignore these spaces.
-    text = re.sub(INDENT_PATTERN, encode_whitespace_cb, text)
+    text = INDENT_PATTERN.sub(encode_whitespace_cb, text)
     # The conversion of leading spaces we just did misses a corner case where a
     # line starts with an HTML tag but the first visible text is a space. Web
     # browsers seem to ignore these spaces, so we need to convert them.
-    text = re.sub(TAG_INDENT_PATTERN, r'\1&nbsp;', text)
+    text = TAG_INDENT_PATTERN.sub(r'\1&nbsp;', text)
     # Convert runs of multiple spaces into non-breaking spaces to avoid HTML
     # rendering engines from visually collapsing runs of spaces into a single
     # space. We specifically don't replace single spaces for several reasons:
@@ -270,7 +273,7 @@ def encode_whitespace(text, tabsize=4):
     # 2. If every single space is replaced by a non-breaking space,
     #    web browsers perform awkwardly unintuitive word wrapping.
     # 3. The HTML output would be bloated for no good reason.
-    text = re.sub(' {2,}', encode_whitespace_cb, text)
+    text = SPACES_PATTERN.sub(encode_whitespace_cb, text)
     return text
 
 
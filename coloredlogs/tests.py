@@ -1,7 +1,7 @@
 # Automated tests for the `coloredlogs' package.
 #
 # Author: Peter Odding <peter@peterodding.com>
-# Last Change: June 11, 2021
+# Last Change: October 16, 2026
 # URL: https://coloredlogs.readthedocs.io
 
 """Automated tests for the `coloredlogs` package."""
@@ -15,6 +15,7 @@ import re
 import subprocess
 import sys
 import tempfile
+import time
 
 # External dependencies.
 from humanfriendly.compat import StringIO
@@ -29,8 +30,10 @@ from coloredlogs import (
     CHROOT_FILES,
     ColoredFormatter,
     NameNormalizer,
+    ProgramNameFilter,
     decrease_verbosity,
     find_defined_levels,
+    find_level_aliases,
     find_handler,
     find_hostname,
     find_program_name,
@@ -130,6 +133,11 @@ class ColoredLogsTestCase(TestCase):
             CHROOT_FILES.insert(0, temporary_file)
             # Make sure the chroot file is being read.
             assert find_hostname() == 'first line'
+            # Make sure the result is cached.
+            assert coloredlogs._hostname_cache[(True, tuple(CHROOT_FILES))] == 'first line'
+            with open(temporary_file, 'w') as handle:
+                handle.write('changed line\n')
+            assert find_hostname() == 'first line'
         finally:
             # Clean up.
             CHROOT_FILES.pop(0)
@@ -137,8 +145,10 @@ class ColoredLogsTestCase(TestCase):
         # Test that unreadable chroot files don't break coloredlogs.
         try:
             CHROOT_FILES.insert(0, temporary_file)
+            coloredlogs._hostname_cache.clear()
             # Make sure that a usable value is still produced.
             assert find_hostname()
+            assert find_hostname() != 'first line'
         finally:
             # Clean up.
             CHROOT_FILES.pop(0)
@@ -159,6 +169,15 @@ class ColoredLogsTestCase(TestCase):
             output = capturer.get_text()
             assert find_program_name() in output
 
+    def test_filters_not_duplicated(self):
+        """Make sure repeated calls to :func:`install()` don't install duplicate filters."""
+        install(fmt='%(programname)s')
+        install(fmt='%(programname)s', programname='coloredlogs-test-suite')
+        handler, logger = find_handler(logging.getLogger(), match_stream_handler)
+        filters = [f for f in handler.filters if isinstance(f, ProgramNameFilter)]
+        assert len(filters) == 1
+        assert filters[0].programname == 'coloredlogs-test-suite'
+
     def test_username_filter(self):
         """Make sure :func:`install()` integrates with :class:`~coloredlogs.UserNameFilter()`."""
         install(fmt='%(username)s')
@@ -225,6 +244,8 @@ class ColoredLogsTestCase(TestCase):
             assert nn.normalize_name(canonical_name.upper()) == canonical_name
         assert nn.normalize_name('warn') == 'warning'
         assert nn.normalize_name('fatal') == 'critical'
+        # Normalized names should be cached.
+        assert nn.normalized_names['fatal'] == 'critical'
 
     def test_style_parsing(self):
         """Make sure :func:`~coloredlogs.parse_encoded_styles()` works as intended."""
@@ -237,6 +258,41 @@ class ColoredLogsTestCase(TestCase):
         assert decoded_styles['critical']['color'] == 'red'
         assert decoded_styles['critical']['bold'] is True
 
+    def test_level_markup(self):
+        """Make sure :class:`~coloredlogs.ColoredFormatter` styles messages based on their level."""
+        formatter = ColoredFormatter(fmt='%(message)s', level_styles=dict(warning=dict(color='yellow')))
+        record = logging.makeLogRecord(dict(levelname='WARN', levelno=logging.WARNING, msg="Careful!"))
+        assert formatter.format(record) == ansi_wrap("Careful!", color='yellow')
+        # The original log record should not be modified.
+        assert record.msg == "Careful!"
+        assert 'message' not in record.__dict__
+        logging.Formatter().format(record)
+        formatter.format(record)
+        assert record.message == "Careful!"
+        # Log levels without a style should not be styled.
+        record = logging.makeLogRecord(dict(levelname='INFO', levelno=logging.INFO, msg="Relax."))
+        assert formatter.format(record) == "Relax."
+        # Level name aliases should be styled the same way.
+        assert formatter.get_level_markup('WARNING') == formatter.get_level_markup('warn')
+        # The escape sequences should be cached by the exact level name.
+        assert formatter.level_markup['WARN'][0] == 'warning'
+
+    def test_level_markup_changes(self):
+        """Make sure changes to :attr:`~coloredlogs.ColoredFormatter.level_styles` take effect."""
+        formatter = ColoredFormatter(fmt='%(message)s')
+        record = logging.makeLogRecord(dict(levelname='ERROR', levelno=logging.ERROR, msg="Oops!"))
+        assert formatter.format(record) == ansi_wrap("Oops!", color='red')
+        # Replacing a style in place should be noticed.
+        formatter.level_styles['error'] = dict(color='blue')
+        assert formatter.format(record) == ansi_wrap("Oops!", color='blue')
+        # Changing a style in place should be noticed.
+        formatter.level_styles['error']['bold'] = True
+        assert formatter.format(record) == ansi_wrap("Oops!", color='blue', bold=True)
+        # Assigning new level styles should discard the cache.
+        formatter.level_styles = {}
+        assert not formatter.level_markup
+        assert formatter.format(record) == "Oops!"
+
     def test_is_verbose(self):
         """Make sure is_verbose() does what it should :-)."""
         set_level(logging.INFO)
@@ -290,6 +346,20 @@ class ColoredLogsTestCase(TestCase):
         # CRITICAL -> CRITICAL.
         decrease_verbosity()
         assert get_level() == logging.CRITICAL
+        # Levels that aren't defined select the closest defined level.
+        set_level(logging.INFO + 2)
+        decrease_verbosity()
+        assert get_level() == logging.NOTICE
+        set_level(logging.INFO + 2)
+        increase_verbosity()
+        assert get_level() == logging.INFO
+        # Levels beyond the defined levels are left unchanged.
+        set_level(logging.CRITICAL + 10)
+        decrease_verbosity()
+        assert get_level() == logging.CRITICAL + 10
+        set_level(logging.NOTSET - 10)
+        increase_verbosity()
+        assert get_level() == logging.NOTSET - 10
 
     def test_level_discovery(self):
         """Make sure find_defined_levels() always reports the levels defined in Python's standard library."""
@@ -297,6 +367,59 @@ class ColoredLogsTestCase(TestCase):
         level_values = defined_levels.values()
         for number in (0, 10, 20, 30, 40, 50):
             assert number in level_values
+        # Make sure custom levels defined after the first call are discovered.
+        assert 'COLOREDLOGS_TEST' not in defined_levels
+        logging.COLOREDLOGS_TEST = 42
+        try:
+            assert find_defined_levels()['COLOREDLOGS_TEST'] == 42
+        finally:
+            del logging.COLOREDLOGS_TEST
+        assert 'COLOREDLOGS_TEST' not in find_defined_levels()
+        # Make sure redefined and replaced levels are noticed.
+        logging.COLOREDLOGS_TEST = 25
+        try:
+            assert level_to_number('coloredlogs_test') == 25
+            logging.COLOREDLOGS_TEST = 27
+            assert level_to_number('coloredlogs_test') == 27
+            assert find_defined_levels()['COLOREDLOGS_TEST'] == 27
+            del logging.COLOREDLOGS_TEST
+            logging.COLOREDLOGS_OTHER = 33
+            try:
+                defined_levels = find_defined_levels()
+                assert 'COLOREDLOGS_TEST' not in defined_levels
+                assert defined_levels['COLOREDLOGS_OTHER'] == 33
+            finally:
+                del logging.COLOREDLOGS_OTHER
+            # Make sure a new level is noticed when an unrelated
+            # attribute disappears at the same time.
+            assert 'COLOREDLOGS_OTHER' not in find_defined_levels()
+            basic_format = logging.BASIC_FORMAT
+            del logging.BASIC_FORMAT
+            logging.COLOREDLOGS_TEST = 15
+            try:
+                assert level_to_number('coloredlogs_test') == 15
+            finally:
+                logging.BASIC_FORMAT = basic_format
+        finally:
+            if hasattr(logging, 'COLOREDLOGS_TEST'):
+                del logging.COLOREDLOGS_TEST
+        # Make sure callers can't corrupt the cached levels.
+        find_defined_levels()['INFO'] = 42
+        assert find_defined_levels()['INFO'] == logging.INFO
+
+    def test_level_alias_discovery(self):
+        """Make sure level aliases and the sorted levels follow redefined levels."""
+        logging.COLOREDLOGS_ALIAS = logging.INFO
+        try:
+            assert find_level_aliases()['INFO'] == 'COLOREDLOGS_ALIAS'
+            assert NameNormalizer().normalize_name('info') == 'coloredlogs_alias'
+            # Redefine the level (without changing the number of attributes).
+            logging.COLOREDLOGS_ALIAS = logging.INFO + 1
+            assert 'INFO' not in find_level_aliases()
+            assert NameNormalizer().normalize_name('info') == 'info'
+            assert logging.INFO + 1 in coloredlogs.find_level_index().sorted_levels
+        finally:
+            del logging.COLOREDLOGS_ALIAS
 
     def test_walk_propagation_tree(self):
         """Make sure walk_propagation_tree() properly walks the tree of loggers."""
@@ -359,6 +482,33 @@ class ColoredLogsTestCase(TestCase):
         logging.info("This should be timestamped according to #45.")
         assert re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}[+-]\d{4}\s', stream.getvalue())
 
+    def test_timestamp_cache(self):
+        """Make sure formatted timestamps are reused within the same second (but not beyond)."""
+        formatter = coloredlogs.BasicFormatter()
+        record = logging.makeLogRecord(dict(created=1500000000.25, msecs=250))
+        text = formatter.formatTime(record)
+        assert formatter.timestamp_cache == (1500000000, coloredlogs.DEFAULT_DATE_FORMAT, text)
+        assert text == time.strftime(coloredlogs.DEFAULT_DATE_FORMAT, time.localtime(1500000000))
+        # Log records created in the same second reuse the timestamp.
+        assert formatter.formatTime(logging.makeLogRecord(dict(created=1500000000.75, msecs=750))) == text
+        # A different date/time format invalidates the cache.
+        assert formatter.formatTime(record, '%H:%M:%S') == text.split()[1]
+        # Timestamps that include milliseconds are never cached.
+        assert formatter.formatTime(record, '%S.%f') == text[-2:] + '.250'
+        # Log records created in a different second get a new timestamp.
+        assert formatter.formatTime(logging.makeLogRecord(dict(created=1500000001.0, msecs=0))) != text
+
+    def test_custom_default_date_format(self):
+        """Make sure changes to :data:`~coloredlogs.DEFAULT_DATE_FORMAT` are respected."""
+        original_format = coloredlogs.DEFAULT_DATE_FORMAT
+        try:
+            coloredlogs.DEFAULT_DATE_FORMAT = '%H:%M:%S'
+            record = logging.makeLogRecord(dict(created=1500000000.25, msecs=250))
+            text = coloredlogs.BasicFormatter().formatTime(record)
+            assert text == time.strftime('%H:%M:%S', time.localtime(1500000000))
+        finally:
+            coloredlogs.DEFAULT_DATE_FORMAT = original_format
+
     def test_plain_text_output_format(self):
         """Inspect the plain text output of coloredlogs."""
         logger = VerboseLogger(random_string(25))